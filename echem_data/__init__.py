@@ -1,2 +1,3 @@
 from .src import electrochem_data
 from .src import electrochem_analysis
+from .src import data_pool
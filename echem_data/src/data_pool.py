@@ -0,0 +1,161 @@
+"""
+Module providing a process-wide, memory-bounded pool of parsed data files
+"""
+
+# Import required modules
+import os
+from collections import OrderedDict
+from pathlib import Path
+import pandas as pd
+
+
+class DataPool:
+    """
+    Least-recently-used pool of parsed data file members keyed by file
+    type, resolved path and modification time
+    """
+    def __init__(self, max_bytes=512 * 1024 ** 2):
+        """
+        Initialize DataPool object with a memory budget in bytes
+        """
+        self.max_bytes = max_bytes
+        self.entries = OrderedDict()
+        self.sizes = {}
+        self._nbytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @staticmethod
+    def make_key(path, file_type):
+        """
+        Return pool key for the file at path parsed by the class file_type
+        """
+        path = Path(path).resolve()
+        return file_type.__name__, str(path), os.stat(path).st_mtime_ns
+
+    def get(self, key):
+        """
+        Return pooled members for key or None if key is not in the pool
+        """
+        if key in self.entries:
+            self.entries.move_to_end(key)
+            self.hits += 1
+            return self.entries[key]
+        self.misses += 1
+        return None
+
+    def peek(self, key):
+        """
+        Return pooled members for key or None without counting a hit or miss
+        and without changing the order of use
+        """
+        return self.entries.get(key)
+
+    def put(self, key, members):
+        """
+        Store members for key, drop entries of older versions of the same
+        file and evict least-recently-used entries when over budget
+        """
+        for old_key in list(self.entries):
+            if old_key[:2] == key[:2] and old_key != key:
+                self.remove(old_key)
+        if key in self.entries:
+            self.remove(key)
+        self.entries[key] = members
+        self.sizes[key] = self.size_of(members)
+        self._nbytes += self.sizes[key]
+        self.trim()
+
+    def grow(self, key, value):
+        """
+        Account for value added lazily to the pooled members of key
+        (e.g. a parsed table) and evict entries when over budget
+        """
+        if key in self.entries:
+            size = self.size_of(value)
+            self.sizes[key] += size
+            self._nbytes += size
+            self.entries.move_to_end(key)
+            self.trim()
+
+    def remove(self, key):
+        """
+        Remove entry of key from the pool
+        """
+        del self.entries[key]
+        self._nbytes -= self.sizes.pop(key)
+
+    def trim(self):
+        """
+        Evict least-recently-used entries until the pool fits its budget,
+        always keeping the most recently used entry
+        """
+        while len(self.entries) > 1 and self._nbytes > self.max_bytes:
+            self.remove(next(iter(self.entries)))
+            self.evictions += 1
+
+    def clear(self):
+        """
+        Remove all entries from the pool and reset its statistics
+        """
+        self.entries.clear()
+        self.sizes.clear()
+        self._nbytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @property
+    def nbytes(self):
+        """
+        Estimated memory in bytes used by all pooled entries
+        """
+        return self._nbytes
+
+    @classmethod
+    def size_of(cls, value, seen=None):
+        """
+        Estimate memory used by the pandas objects contained in value,
+        counting objects already contained in seen only once
+        """
+        if seen is None:
+            seen = set()
+        if id(value) in seen:
+            return 0
+        seen.add(id(value))
+        if isinstance(value, pd.DataFrame):
+            return int(value.memory_usage(deep=True).sum())
+        if isinstance(value, dict):
+            return sum(cls.size_of(item, seen) for item in value.values())
+        if isinstance(value, (list, tuple)):
+            return sum(cls.size_of(item, seen) for item in value)
+        return 0
+
+    def stats(self):
+        """
+        Return dictionary with hit/miss statistics and memory usage
+        """
+        return {'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'entries': len(self.entries),
+                'nbytes': self.nbytes,
+                'max_bytes': self.max_bytes}
+
+
+def consumer_copy(value):
+    """
+    Return copy of pooled value which can be modified by a single consumer
+    (e.g. by derived columns) without altering the pooled object; frames
+    are copied deeply, as shallow copies share their data on pandas < 3
+    """
+    if isinstance(value, pd.DataFrame):
+        return value.copy(deep=True)
+    if isinstance(value, dict):
+        return dict(value)
+    return value
+
+
+# Process-wide pool shared by all data file objects
+DATA_POOL = DataPool()
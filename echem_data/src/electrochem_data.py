@@ -3,26 +3,81 @@ Module to process measurement data from a Gamry Instruments potentiostat
 """
 
 # Import required modules
+import io
 import os
 import re
 import pandas as pd
 import sys
 from abc import ABC, abstractmethod
 from pathlib import Path
+from echem_data.src.data_pool import DATA_POOL, consumer_copy
 
 
-class DataFile(ABC):
+class DataIndexing:
+    """
+    Mixin providing direct indexing of the data member
+    """
+    def __getitem__(self, key):
+        if isinstance(key, (tuple, list)):
+            if all(isinstance(x, int) for x in key):
+                return self.data.iloc[key]
+            if all(isinstance(x, str) for x in key):
+                return self.data[key]
+        elif isinstance(key, (int, slice)):
+            return self.data.iloc[key]
+        elif isinstance(key, str):
+            return self.data[key]
+        else:
+            raise TypeError('Type is not accepted for direct indexing')
+
+
+class DataFile(DataIndexing, ABC):
     """
     Base class to process data files
     """
+    POOLED_MEMBERS = ('header', 'data', 'units')
+    SHARED_MEMBERS = ()
+
     def __init__(self, path):
         """
-        Initialize DataFile object by reading the file and storing
-        corresponding members
+        Initialize DataFile object by reading the file (or drawing its parsed
+        members from the shared DATA_POOL) and storing corresponding members
         """
         self.path = Path(path)
         self.file_name = os.path.split(path)[1]
-        self.header, self.data, self.units = self.read(path)
+        self.load(path)
+
+    def load(self, path, pool=DATA_POOL):
+        """
+        Assign parsed members from pool if the unchanged file was already
+        read, otherwise read the file and add its members to the pool
+        """
+        self.pool = pool
+        self.pool_key = None
+        try:
+            key = pool.make_key(path, type(self))
+        except FileNotFoundError:
+            # Leave handling of missing files to the read implementation
+            members = self.read_members(path)
+        else:
+            members = pool.get(key)
+            if members is None:
+                members = self.read_members(path)
+                pool.put(key, members)
+            self.pool_key = key
+        # Each consumer works on its own copies, so that derived members
+        # (e.g. current density) do not alter the pooled objects
+        for name, value in members.items():
+            if name not in self.SHARED_MEMBERS:
+                value = consumer_copy(value)
+            setattr(self, name, value)
+
+    def read_members(self, path):
+        """
+        Read in file and return dictionary of all members named in
+        POOLED_MEMBERS
+        """
+        return dict(zip(self.POOLED_MEMBERS, self.read(path)))
 
     @staticmethod
     def read_as_list(input_file, codec='utf-8'):
@@ -51,19 +106,6 @@ class DataFile(ABC):
         """
         pass
 
-    def __getitem__(self, key):
-        if isinstance(key, (tuple, list)):
-            if all(isinstance(x, int) for x in key):
-                return self.data.iloc[key]
-            if all(isinstance(x, str) for x in key):
-                return self.data[key]
-        elif isinstance(key, (int, slice)):
-            return self.data.iloc[key]
-        elif isinstance(key, str):
-            return self.data[key]
-        else:
-            raise TypeError('Type is not accepted for direct indexing')
-
 
 class EChemDataFile(DataFile, ABC):
     """
@@ -105,12 +147,58 @@ class EChemDataFile(DataFile, ABC):
         pass
 
 
+class DTATable(DataIndexing):
+    """
+    Single table block of a Gamry DTA-file bound to one DTAFile object,
+    which is only parsed on first access of its data or units
+    """
+    def __init__(self, dta_file, name, start, stop, n_rows):
+        """
+        Initialize DTATable object with the byte range (start, stop) of the
+        table block inside the file, starting at its column name line
+        """
+        self.dta_file = dta_file
+        self.name = name
+        self.start = start
+        self.stop = stop
+        self.n_rows = n_rows
+        self._data = None
+        self._units = None
+
+    @property
+    def header(self):
+        return self.dta_file.header
+
+    @property
+    def is_parsed(self):
+        return self._data is not None
+
+    @property
+    def data(self):
+        if self._data is None:
+            self._data, self._units = self.dta_file.read_table(self)
+        return self._data
+
+    @property
+    def units(self):
+        if self._units is None:
+            self._data, self._units = self.dta_file.read_table(self)
+        return self._units
+
+
 class DTAFile(EChemDataFile):
     """
     Subclass of EChemDataFile to process Gamry DTA-files
     """
     FILE_ENDING = 'DTA'
     HEADER_ENDING = 'CURVE'
+    POOLED_MEMBERS = DataFile.POOLED_MEMBERS + ('table_index',
+                                               'parsed_tables',
+                                               'source_mtime')
+    # Cache of parsed tables shared by all DTAFile objects of the same file,
+    # its frames are only handed out as consumer copies
+    SHARED_MEMBERS = ('parsed_tables',)
+    TABLE_PATTERN = re.compile(r'^(\w+)\tTABLE\t(\d+)')
     NAMES = {'Vf': 'Voltage',
              'Im': 'Current',
              'Pwr': 'Power',
@@ -120,14 +208,135 @@ class DTAFile(EChemDataFile):
     DECIMAL = ','
     CODEC = 'utf-8'
 
+    def load(self, path, pool=DATA_POOL):
+        """
+        Assign members from pool or file and bind DTATable objects for all
+        indexed table blocks to this DTAFile object
+        """
+        self.source_path = Path(path).resolve()
+        super().load(path, pool)
+        self.tables = {name: DTATable(self, name, *block)
+                       for name, block in self.table_index.items()}
+
     def read(self, path):
         """
-        Read in DTA-file and return list of lines
+        Read in DTA-file and return header, data and units of the main
+        table (CURVE)
         """
-        lines = self.read_as_list(path, self.CODEC)
-        header, header_length = self.read_header(lines)
-        data = pd.read_csv(path, header=[header_length, header_length+1],
-                           delimiter=self.DELIMITER, decimal=self.DECIMAL)
+        members = self.read_members(path)
+        return members['header'], members['data'], members['units']
+
+    def read_members(self, path):
+        """
+        Index all table blocks of DTA-file in a single pass, parse the main
+        table (CURVE) and return dictionary of all POOLED_MEMBERS; repeated
+        table names are kept in file order with a suffix (CURVE, CURVE_2, ...)
+        """
+        header, table_index, source_mtime = self.read_header(path)
+        if not table_index:
+            raise ValueError('No table was found in DTA-file: ' + str(path))
+        if self.HEADER_ENDING in table_index:
+            name = self.HEADER_ENDING
+        else:
+            name = next(iter(table_index))
+        start, stop, _ = table_index[name]
+        data, units = self.parse_table(path, start, stop)
+        return {'header': header,
+                'data': data,
+                'units': units,
+                'table_index': table_index,
+                'parsed_tables': {name: (data, units)},
+                'source_mtime': source_mtime}
+
+    def read_header(self, path):
+        """
+        Extract header as dictionary, table index as dictionary of table
+        names and (start, stop, n_rows) of each table block and modification
+        time of the data file from a single scan over the data file
+        """
+        header_list = []
+        table_index = {}
+        name = None
+        offset = 0
+        try:
+            with open(path, 'rb') as f:
+                mtime = os.fstat(f.fileno()).st_mtime_ns
+                for line in f:
+                    if name is not None and line.startswith(b'\t'):
+                        table_index[name][1] = offset + len(line)
+                    else:
+                        name = None
+                        text = line.decode(self.CODEC).strip()
+                        match = self.TABLE_PATTERN.match(text)
+                        if match:
+                            name = self.unique_table_name(match.group(1),
+                                                          table_index)
+                            table_index[name] = [offset + len(line),
+                                                 offset + len(line),
+                                                 int(match.group(2))]
+                            # Key header entry by the unique table name
+                            text = name + text[len(match.group(1)):]
+                        header_list.append(text)
+                    offset += len(line)
+        except FileNotFoundError:
+            print("File was not found: \n", path)
+            sys.exit()
+        header_dict = {}
+        for line in header_list:
+            if line and not line.startswith('#'):
+                line_list = line.split('\t')
+                header_dict[line_list[0]] = tuple(line_list[1:])
+        table_index = {key: tuple(value) for key, value in table_index.items()}
+        return header_dict, table_index, mtime
+
+    @staticmethod
+    def unique_table_name(name, names):
+        """
+        Return name suffixed by its occurrence count (e.g. CURVE_2) if it is
+        already contained in names
+        """
+        unique_name = name
+        count = 2
+        while unique_name in names:
+            unique_name = name + '_' + str(count)
+            count += 1
+        return unique_name
+
+    def read_table(self, table):
+        """
+        Return copies of data and units of the provided DTATable, its byte
+        range is only parsed once for all DTAFile objects of the same file
+        """
+        # Switch to the cache of the live pool entry, if the entry this object
+        # was drawn from has been evicted and stored again in the meantime
+        members = self.pool.peek(self.pool_key)
+        if members is not None:
+            self.parsed_tables = members['parsed_tables']
+        if table.name not in self.parsed_tables:
+            if os.stat(self.source_path).st_mtime_ns != self.source_mtime:
+                raise ValueError('DTA-file was modified after its tables '
+                                 'were indexed, create a new DTAFile '
+                                 'object to read it: '
+                                 + str(self.source_path))
+            parsed = self.parse_table(self.source_path, table.start,
+                                      table.stop)
+            self.parsed_tables[table.name] = parsed
+            if members is not None:
+                self.pool.grow(self.pool_key, parsed)
+        data, units = self.parsed_tables[table.name]
+        return consumer_copy(data), consumer_copy(units)
+
+    def parse_table(self, path, start, stop):
+        """
+        Parse only the byte range (start, stop) of the data file and return
+        data and units of the table block
+        """
+        with open(path, 'rb') as f:
+            f.seek(start)
+            block = f.read(stop - start)
+        data = pd.read_csv(io.BytesIO(block), header=[0, 1],
+                           delimiter=self.DELIMITER, decimal=self.DECIMAL,
+                           encoding=self.CODEC)
         data.drop(data.columns[[0, 1]], axis=1, inplace=True)
         data.rename(columns=self.NAMES, inplace=True)
         columns = []
@@ -137,23 +346,19 @@ class DTAFile(EChemDataFile):
         for index, code in enumerate(data.columns.codes[1]):
             units[columns[index]] = data.columns.levels[1][code]
         data.columns = columns
-        return header, data, units
+        return data, units
 
-    def read_header(self, lines):
+    def read_tables(self, names=None):
         """
-        Extract header as dictionary from total list of lines of data file
+        Return dictionary of parsed data for the requested table names
+        (all tables if names is not provided), which belongs to this
+        DTAFile object only
         """
-        header_list = []
-        for line in lines:
-            header_list.append(line.strip())
-            if self.HEADER_ENDING in line:
-                break
-        header_dict = {}
-        for line in header_list:
-            if line and not line.startswith('#'):
-                line_list = line.split('\t')
-                header_dict[line_list[0]] = tuple(line_list[1:])
-        return header_dict, len(header_list)
+        if names is None:
+            names = list(self.tables)
+        elif isinstance(names, str):
+            names = [names]
+        return {name: self.tables[name].data for name in names}
 
     def calculate_current_density(self, electrode_area):
         """
@@ -0,0 +1,55 @@
+"""
+Shared fixtures for tests of the echem_data package
+"""
+
+# Import required modules
+from pathlib import Path
+import pytest
+from echem_data.src.data_pool import DATA_POOL
+
+GAMRY_FILE = Path(__file__).parent.parent.joinpath(
+    'TestData', 'Gamry', '0k8V_zn12_paa1_20181112', 'Data',
+    'PWRPOTSTAT_ps10_zn12_paa1_v08.DTA')
+
+
+def write_multi_block_file(path):
+    """
+    Write DTA-file with an OCVCURVE block and two CURVE blocks built from
+    the Gamry test data and return the number of rows for each block
+    """
+    lines = GAMRY_FILE.read_text(encoding='utf-8').splitlines()
+    start = [i for i, line in enumerate(lines)
+             if line.startswith('CURVE\t')][0]
+    header, columns, rows = lines[:start], lines[start+1:start+3], \
+        lines[start+3:]
+    blocks = [('OCVCURVE', rows[:3]), ('CURVE', rows[:10]), ('CURVE', rows)]
+    content = list(header)
+    for i, (name, block_rows) in enumerate(blocks):
+        content.append(name + '\tTABLE\t' + str(len(block_rows)))
+        content.extend(columns + block_rows)
+        content.append('EOC' + str(i) + '\tQUANT\t0,8\tOpen Circuit (V)')
+    path.write_text('\n'.join(content) + '\n', encoding='utf-8')
+    return [len(block_rows) for _, block_rows in blocks]
+
+
+@pytest.fixture
+def gamry_file():
+    return GAMRY_FILE
+
+
+@pytest.fixture
+def multi_block_file(tmp_path):
+    path = tmp_path / 'multi.DTA'
+    return path, write_multi_block_file(path)
+
+
+@pytest.fixture(autouse=True)
+def data_pool():
+    """
+    Provide empty process-wide data pool for each test
+    """
+    max_bytes = DATA_POOL.max_bytes
+    DATA_POOL.clear()
+    yield DATA_POOL
+    DATA_POOL.clear()
+    DATA_POOL.max_bytes = max_bytes
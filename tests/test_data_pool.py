@@ -0,0 +1,149 @@
+"""
+Tests for sharing parsed data files through the process-wide data pool
+"""
+
+# Import required modules
+import os
+from pathlib import Path
+import echem_data.src.electrochem_data as ed
+import echem_data.src.electrochem_analysis as ea
+
+GAMRY_DIR = Path(__file__).parent.parent.joinpath('TestData', 'Gamry')
+ELECTRODE_AREA = {'name': 'Electrode Surface Area', 'value': 0.5,
+                  'unit': 'm^2'}
+
+
+def test_hits_and_misses(data_pool, gamry_file):
+    ed.EChemDataFile(gamry_file, 'DTA')
+    ed.EChemDataFile(gamry_file, 'DTA')
+    stats = data_pool.stats()
+    assert stats['misses'] == 1
+    assert stats['hits'] == 1
+    assert stats['entries'] == 1
+    assert stats['nbytes'] > 0
+
+
+def test_modified_file_is_read_again(data_pool, multi_block_file):
+    path, _ = multi_block_file
+    ed.EChemDataFile(path, 'DTA')
+    stat = os.stat(path)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10 ** 9))
+    ed.EChemDataFile(path, 'DTA')
+    assert data_pool.stats()['misses'] == 2
+    assert data_pool.stats()['entries'] == 1
+
+
+def test_data_is_isolated_per_consumer(multi_block_file):
+    path, _ = multi_block_file
+    a = ed.EChemDataFile(path, 'DTA')
+    b = ed.EChemDataFile(path, 'DTA')
+    current = b.data['Current'].copy()
+    a.calculate_current_density(ELECTRODE_AREA)
+    a.data.loc[0, 'Current'] = 999.0
+    a.data['Current'] /= 2
+    a.header['EXTRA'] = ('1',)
+    assert 'Current Density' not in b.data
+    assert 'Current Density' not in b.units
+    assert 'EXTRA' not in b.header
+    assert b.data['Current'].equals(current)
+    c = ed.EChemDataFile(path, 'DTA')
+    assert c.data['Current'].equals(current)
+
+
+def test_tables_are_isolated_per_consumer(multi_block_file):
+    path, _ = multi_block_file
+    a = ed.EChemDataFile(path, 'DTA')
+    b = ed.EChemDataFile(path, 'DTA')
+    a.tables['OCVCURVE'].data['X'] = 1
+    a.read_tables('CURVE_2')['CURVE_2']['X'] = 1
+    assert 'X' not in b.tables['OCVCURVE'].data
+    assert 'X' not in b.read_tables('CURVE_2')['CURVE_2']
+    assert b.tables['OCVCURVE'].header is b.header
+    assert b.tables['OCVCURVE'].dta_file is b
+
+
+def test_tables_are_read_from_resolved_path(multi_block_file, monkeypatch):
+    path, n_rows = multi_block_file
+    monkeypatch.chdir(path.parent)
+    ed.EChemDataFile(path.name, 'DTA')
+    monkeypatch.chdir(path.anchor)
+    dta_file = ed.EChemDataFile(path, 'DTA')
+    assert len(dta_file.tables['OCVCURVE'].data) == n_rows[0]
+
+
+def test_tables_are_parsed_once(data_pool, multi_block_file):
+    path, _ = multi_block_file
+    a = ed.EChemDataFile(path, 'DTA')
+    nbytes = data_pool.nbytes
+    a.read_tables('CURVE_2')
+    grown_nbytes = data_pool.nbytes
+    assert grown_nbytes > nbytes
+    b = ed.EChemDataFile(path, 'DTA')
+    assert b.tables['CURVE_2'].data.equals(a.tables['CURVE_2'].data)
+    assert data_pool.nbytes == grown_nbytes
+
+
+def test_least_recently_used_entry_is_evicted(data_pool, gamry_file,
+                                              multi_block_file):
+    path, _ = multi_block_file
+    ed.EChemDataFile(gamry_file, 'DTA')
+    ed.EChemDataFile(path, 'DTA')
+    ed.EChemDataFile(gamry_file, 'DTA')
+    data_pool.max_bytes = data_pool.nbytes
+    ed.EChemDataFile(path, 'DTA').read_tables('CURVE_2')
+    stats = data_pool.stats()
+    assert stats['evictions'] == 1
+    assert stats['entries'] == 1
+    assert stats['nbytes'] == data_pool.size_of(
+        next(iter(data_pool.entries.values())))
+    ed.EChemDataFile(gamry_file, 'DTA')
+    assert data_pool.stats()['misses'] == 3
+
+
+def test_lazy_table_of_evicted_consumer(data_pool, gamry_file,
+                                        multi_block_file):
+    path, n_rows = multi_block_file
+    data_pool.max_bytes = 1
+    a = ed.EChemDataFile(path, 'DTA')
+    ed.EChemDataFile(gamry_file, 'DTA')
+    b = ed.EChemDataFile(path, 'DTA')
+    assert data_pool.stats()['evictions'] == 2
+    assert len(a.read_tables('OCVCURVE')['OCVCURVE']) == n_rows[0]
+    members = data_pool.peek(data_pool.make_key(path, type(a)))
+    assert 'OCVCURVE' in members['parsed_tables']
+    assert data_pool.nbytes == data_pool.size_of(members)
+    c = ed.EChemDataFile(path, 'DTA')
+    assert c.parsed_tables is b.parsed_tables
+    assert c.tables['OCVCURVE'].data.equals(a.tables['OCVCURVE'].data)
+
+
+def test_members_are_returned_explicitly(multi_block_file):
+    path, _ = multi_block_file
+    dta_file = ed.EChemDataFile(path, 'DTA')
+    members = dta_file.read_members(path)
+    assert set(members) == set(dta_file.POOLED_MEMBERS)
+    assert list(members['table_index']) == list(dta_file.tables)
+
+
+def test_clear_resets_statistics(data_pool, gamry_file):
+    ed.EChemDataFile(gamry_file, 'DTA')
+    data_pool.clear()
+    stats = data_pool.stats()
+    assert stats['misses'] == 0
+    assert stats['entries'] == 0
+    assert stats['nbytes'] == 0
+
+
+def test_curves_share_data_files(data_pool):
+    curve = ea.Curve(GAMRY_DIR / '0k8V_zn8_paa1_20181112', 'DTA')
+    multi_curve = ea.MultiCurve(GAMRY_DIR, 'DTA')
+    # Data files and info file of the first folder are drawn from the pool
+    assert data_pool.stats()['hits'] == len(curve.data_objects) + 1
+    shared_curve = [item for item in multi_curve.curves
+                    if Path(item.work_dir) == Path(curve.work_dir)][0]
+    for item, shared_item in zip(curve.data_objects,
+                                 shared_curve.data_objects):
+        assert item.file_name == shared_item.file_name
+        assert item.data is not shared_item.data
+        assert item.data['Current Density'].equals(
+            shared_item.data['Current Density'])
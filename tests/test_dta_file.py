@@ -0,0 +1,75 @@
+"""
+Tests for reading multi-block Gamry DTA-files
+"""
+
+# Import required modules
+import os
+import pytest
+import echem_data.src.electrochem_data as ed
+
+
+def test_single_block_file(gamry_file):
+    dta_file = ed.EChemDataFile(gamry_file, 'DTA')
+    assert list(dta_file.tables) == ['CURVE']
+    assert len(dta_file.data) == 66
+    assert dta_file.units['Current'] == 'A'
+    assert dta_file.header['CURVE'] == ('TABLE', '66')
+
+
+def test_all_blocks_are_indexed(multi_block_file):
+    path, n_rows = multi_block_file
+    dta_file = ed.EChemDataFile(path, 'DTA')
+    assert list(dta_file.tables) == ['OCVCURVE', 'CURVE', 'CURVE_2']
+    assert [table.n_rows for table in dta_file.tables.values()] == n_rows
+    assert 'EOC2' in dta_file.header
+    # Main data refers to the first CURVE block
+    assert len(dta_file.data) == n_rows[1]
+
+
+def test_blocks_are_parsed_lazily(multi_block_file):
+    path, n_rows = multi_block_file
+    dta_file = ed.EChemDataFile(path, 'DTA')
+    assert not dta_file.tables['OCVCURVE'].is_parsed
+    tables = dta_file.read_tables('OCVCURVE')
+    assert list(tables) == ['OCVCURVE']
+    assert len(tables['OCVCURVE']) == n_rows[0]
+    assert dta_file.tables['OCVCURVE'].is_parsed
+    assert not dta_file.tables['CURVE_2'].is_parsed
+
+
+def test_read_all_tables(multi_block_file):
+    path, n_rows = multi_block_file
+    dta_file = ed.EChemDataFile(path, 'DTA')
+    tables = dta_file.read_tables()
+    assert [len(data) for data in tables.values()] == n_rows
+    for name, table in dta_file.tables.items():
+        assert table.header is dta_file.header
+        assert table.units['Voltage'] == 'V'
+        assert list(table.data.columns) == list(dta_file.data.columns)
+
+
+def test_header_keys_of_repeated_tables(multi_block_file):
+    path, n_rows = multi_block_file
+    dta_file = ed.EChemDataFile(path, 'DTA')
+    assert dta_file.header['CURVE'] == ('TABLE', str(n_rows[1]))
+    assert dta_file.header['CURVE_2'] == ('TABLE', str(n_rows[2]))
+
+
+def test_table_indexing(multi_block_file):
+    path, _ = multi_block_file
+    table = ed.EChemDataFile(path, 'DTA').tables['OCVCURVE']
+    assert table['Current'].equals(table.data['Current'])
+    assert table[0].equals(table.data.iloc[0])
+    with pytest.raises(TypeError):
+        table[1.0]
+
+
+def test_modified_file_is_not_read_from_stale_index(multi_block_file):
+    path, _ = multi_block_file
+    dta_file = ed.EChemDataFile(path, 'DTA')
+    stat = os.stat(path)
+    path.write_text('EXTRA\tLABEL\t1\n' + path.read_text(encoding='utf-8'),
+                    encoding='utf-8')
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10 ** 9))
+    with pytest.raises(ValueError):
+        dta_file.read_tables('OCVCURVE')